@@ -12,6 +12,7 @@ Usage:
     python redteam.py test           # Run adversarial tests (default: owasp_multi_turn)
     python redteam.py test --single  # Run single-turn attacks
     python redteam.py test --adaptive # Run adaptive multi-turn attacks
+    python redteam.py test --all     # Run every test category concurrently
     python redteam.py status         # Check experiment status
     python redteam.py logs           # View test findings
     python redteam.py logs --failed  # View only failed findings
@@ -21,16 +22,26 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
+import functools
 import os
-import subprocess
+import shlex
 import sys
+import time
 
-from dotenv import load_dotenv
+# Heavier modules (dotenv, jsonschema, aiolimiter, aiandme, json, hashlib)
+# are imported inside the functions that need them, so quick commands such
+# as ``setup`` don't pay for them at start-up.
 
 # ── Constants ───────────────────────────────────────────────────────────
 
-BOT_CONFIG_FILE = os.path.join(os.path.dirname(__file__), "bot.json")
+_HERE = os.path.dirname(__file__)
+_ENV_PATH = os.path.join(_HERE, ".env")
+BOT_CONFIG_FILE = os.path.join(_HERE, "bot.json")
+BOT_CONFIG_HASH_FILE = BOT_CONFIG_FILE + ".sha"
+# Bump whenever the bot.json template or schema changes so existing files
+# are regenerated even though the .env values didn't change.
+BOT_CONFIG_FORMAT_VERSION = 1
 
 TEST_CATEGORIES = {
     "single": "aiandme/adversarial/owasp_single_turn",
@@ -41,12 +52,70 @@ TEST_CATEGORIES = {
 
 TEST_LEVELS = ("unit", "system", "acceptance")
 
+_ENDPOINT_SCHEMA = {
+    "type": "object",
+    "required": ["endpoint", "headers", "payload"],
+    "properties": {
+        "endpoint": {"type": "string"},
+        "headers": {"type": "object", "additionalProperties": {"type": "string"}},
+        "payload": {"type": "object"},
+    },
+}
+
+# Shape of the bot.json file handed to ``aiandme -e``
+BOT_JSON_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["streaming", "thread_auth", "thread_init", "chat_completion"],
+    "properties": {
+        "streaming": {"type": "boolean"},
+        "thread_auth": _ENDPOINT_SCHEMA,
+        "thread_init": _ENDPOINT_SCHEMA,
+        "chat_completion": {
+            "allOf": [
+                _ENDPOINT_SCHEMA,
+                {"properties": {"endpoint": {"minLength": 1}}},
+            ],
+        },
+    },
+}
+
+# Fixed argv tuples used by the full workflow and login check
+_WHOAMI_CMD = ("aiandme", "whoami")
+_LOGIN_CMD = ("aiandme", "login")
+_INIT_CMD = ("aiandme", "init", "-e", BOT_CONFIG_FILE)
+_SINGLE_CMD = (
+    "aiandme", "test", "-e", BOT_CONFIG_FILE,
+    "-t", TEST_CATEGORIES["single"], "-l", "unit", "--wait",
+)
+_MULTI_CMD = (
+    "aiandme", "test", "-e", BOT_CONFIG_FILE,
+    "-t", TEST_CATEGORIES["multi"], "-l", "unit", "--wait",
+)
+_POSTURE_CMD = ("aiandme", "posture")
+_FAILED_LOGS_CMD = ("aiandme", "logs", "--verdict", "fail")
+
+DEFAULT_MAX_CONCURRENT = 3
+DEFAULT_RATE_PER_MINUTE = 60
+
+# Retry policy for flaky network / backend failures
+MAX_RETRIES = 3
+TRANSIENT_EXIT_CODES = (75,)  # EX_TEMPFAIL
+# Read-only aiandme subcommands that are safe to run more than once;
+# init and test create backend projects/experiments and are never retried.
+RETRYABLE_COMMANDS = ("whoami", "status", "posture", "logs")
+
+PUMP_CHUNK_SIZE = 64 * 1024
+
 
 # ── Helpers ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def load_config():
     """Load API credentials from .env and return (url, key)."""
-    load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
+    from dotenv import load_dotenv
+
+    load_dotenv(_ENV_PATH)
     url = os.environ.get("FOODIE_API_URL")
     key = os.environ.get("FOODIE_API_KEY")
     if not url or not key:
@@ -57,43 +126,340 @@ def load_config():
     return url, key
 
 
-def run(cmd, check=True):
-    """Run a shell command, streaming output to the terminal."""
-    print(f"\n>>> {cmd}\n")
-    result = subprocess.run(cmd, shell=True, check=False)
-    if check and result.returncode != 0:
-        print(f"\nCommand exited with code {result.returncode}")
+def retry_delay(returncode, attempt, max_retries, prefix=""):
+    """Return the backoff before the next attempt, or None to stop.
+
+    Transient failures are retried with exponential backoff (1s, 2s, 4s,
+    ...); success and anything else end the loop straight away.
+    """
+    if returncode == 0 or not is_transient(returncode) or attempt == max_retries - 1:
+        return None
+    delay = 2 ** attempt
+    print(f"\n{prefix}Transient failure (exit {returncode}), retrying in {delay}s...")
+    return delay
+
+
+async def async_retry(fn, max_retries=MAX_RETRIES, prefix=""):
+    """Await ``fn()``, which returns an exit code, until it stops failing."""
+    for attempt in range(max_retries):
+        returncode = await fn()
+        delay = retry_delay(returncode, attempt, max_retries, prefix)
+        if delay is None:
+            return returncode
+        await asyncio.sleep(delay)
+
+
+def retry(fn, max_retries=MAX_RETRIES):
+    """Synchronous counterpart of ``async_retry``."""
+    for attempt in range(max_retries):
+        returncode = fn()
+        delay = retry_delay(returncode, attempt, max_retries)
+        if delay is None:
+            return returncode
+        time.sleep(delay)
+
+
+def is_transient(returncode):
+    """Return True if a failed run's exit code marks it as worth retrying.
+
+    Only exit codes are trusted: output text can mention 429s or timeouts
+    in findings or IDs, and re-running ``test --wait`` or ``init`` creates
+    new backend experiments.
+    """
+    return returncode in TRANSIENT_EXIT_CODES
+
+
+def retry_limit(argv):
+    """Return how many attempts ``argv`` may get: only read-only commands retry."""
+    if argv[0] == "aiandme" and len(argv) > 1 and argv[1] in RETRYABLE_COMMANDS:
+        return MAX_RETRIES
+    return 1
+
+
+async def pump(stream, prefix):
+    """Copy a child's output to stdout line by line, prefixing each line.
+
+    Reads fixed-size chunks rather than ``readline()`` so a single huge
+    line (e.g. a JSON dump) can't overrun the stream buffer limit, and the
+    pipe keeps draining while the child is still writing.
+    """
+    pending = b""
+    while True:
+        chunk = await stream.read(PUMP_CHUNK_SIZE)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            emit_line(prefix, line + b"\n")
+    if pending:
+        emit_line(prefix, pending + b"\n")
+
+
+def emit_line(prefix, line):
+    """Decode one line of child output and write it to stdout with a prefix."""
+    text = line.decode(errors="replace")
+    sys.stdout.write(prefix + text)
+    sys.stdout.flush()
+
+
+async def run_async(argv, check=True, tag=None, limiter=None):
+    """Run an argv command asynchronously, streaming output to the terminal.
+
+    When ``tag`` is given the child's output is piped and every line is
+    prefixed with ``[tag]`` so concurrent runs stay readable. When
+    ``limiter`` (an ``AsyncLimiter``) is given, each spawn waits for a slot.
+    Transient failures of read-only commands are retried with
+    ``async_retry``.
+    """
+    prefix = f"[{tag}] " if tag else ""
+
+    async def attempt():
+        if limiter is not None:
+            await limiter.acquire()
+        print(f"\n{prefix}>>> {shlex.join(argv)}\n")
+        # No shell: argv goes straight to exec, so values such as API keys
+        # are never re-parsed or word-split.
+        try:
+            if not tag:
+                proc = await asyncio.create_subprocess_exec(*argv)
+                return await proc.wait()
+
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except FileNotFoundError:
+            print(f"{prefix}{argv[0]}: command not found")
+            return 127
+        returncode, _ = await asyncio.gather(
+            proc.wait(), pump(proc.stdout, prefix),
+        )
+        return returncode
+
+    returncode = await async_retry(attempt, retry_limit(argv), prefix)
+    return report_exit(returncode, check, prefix)
+
+
+def report_exit(returncode, check=True, prefix=""):
+    """Report a nonzero exit code when ``check`` is set; return success."""
+    if check and returncode != 0:
+        print(f"\n{prefix}Command exited with code {returncode}")
         return False
     return True
 
 
+async def run_bounded(jobs, max_concurrent=DEFAULT_MAX_CONCURRENT,
+                      rate=DEFAULT_RATE_PER_MINUTE, check=True):
+    """Run ``(argv, tag)`` jobs concurrently.
+
+    At most ``max_concurrent`` jobs are in flight, and spawns are spaced at
+    least ``60 / rate`` seconds apart. The bucket holds a single token, so
+    there is no initial burst.
+    """
+    from aiolimiter import AsyncLimiter
+
+    sem = asyncio.Semaphore(max_concurrent)
+    limiter = AsyncLimiter(1, 60 / rate)
+
+    async def worker(cmd, tag):
+        async with sem:
+            return await run_async(cmd, check, tag=tag, limiter=limiter)
+
+    return await asyncio.gather(*(worker(cmd, tag) for cmd, tag in jobs))
+
+
+@functools.lru_cache(maxsize=1)
+def aiandme_entry_point():
+    """Return aiandme's CLI ``main`` if it can be called in-process, else None.
+
+    aiandme is itself Python — calling it in-process avoids a fork/exec and
+    a fresh interpreter start-up per command. The package must import and
+    ``main`` must accept a single argv list; otherwise callers use a
+    subprocess, decided before any aiandme work starts.
+    """
+    import inspect
+
+    try:
+        from aiandme.cli import main
+    except ImportError:
+        return None
+    try:
+        inspect.signature(main).bind([])
+    except TypeError:
+        return None
+    except ValueError:
+        pass  # no introspectable signature; assume the documented one
+    return main
+
+
+def call_aiandme(args):
+    """Invoke the aiandme entry point in-process and return its exit code.
+
+    ``SystemExit`` is mapped to its exit code. Any other exception is
+    reported as a failure: aiandme may already have created backend state,
+    so the command is never re-run as a subprocess.
+    """
+    try:
+        result = aiandme_entry_point()(list(args))
+    except SystemExit as exc:
+        result = exc.code
+    except Exception as exc:
+        print(f"aiandme raised {type(exc).__name__}: {exc}")
+        return 1
+    if result is None:
+        return 0
+    if isinstance(result, int):
+        return result
+    print(result)
+    return 1
+
+
+def run(argv, check=True):
+    """Run a command given as an argv list, streaming output to the terminal.
+
+    aiandme commands run in-process when the entry point is usable, and as
+    a subprocess otherwise. The in-process call runs on the main thread
+    outside any event loop, so Ctrl-C interrupts it directly and aiandme is
+    free to use ``asyncio.run`` itself.
+    """
+    if argv[0] != "aiandme" or aiandme_entry_point() is None:
+        return asyncio.run(run_async(argv, check))
+
+    def attempt():
+        print(f"\n>>> {shlex.join(argv)}\n")
+        return call_aiandme(argv[1:])
+
+    returncode = retry(attempt, retry_limit(argv))
+    return report_exit(returncode, check)
+
+
+def read_text(path):
+    """Return the stripped contents of ``path``, or None if unreadable."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_atomic(path, text):
+    """Write ``text`` to ``path`` via a private temp file and ``os.replace``."""
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=os.path.dirname(path),
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        f.write(text)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.remove(f.name)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def bot_json_validator():
+    """Return the compiled bot.json validator, building it on first use."""
+    import jsonschema
+
+    return jsonschema.Draft7Validator(BOT_JSON_SCHEMA)
+
+
+def bot_json_problem():
+    """Return why the bot.json on disk is unusable, or None if it is fine."""
+    import json
+
+    try:
+        with open(BOT_CONFIG_FILE) as f:
+            bot_config = json.load(f)
+    except FileNotFoundError:
+        return "not found"
+    except (OSError, ValueError) as exc:
+        return f"unreadable ({exc})"
+
+    error = next(bot_json_validator().iter_errors(bot_config), None)
+    if error is not None:
+        return f"invalid ({error.message})"
+    return None
+
+
 def ensure_bot_json():
-    """Make sure bot.json exists, generating it if needed."""
-    if not os.path.exists(BOT_CONFIG_FILE):
-        print("bot.json not found — generating it now.\n")
+    """Make sure a valid bot.json exists, generating it if needed."""
+    problem = bot_json_problem()
+    if problem is not None:
+        print(f"bot.json {problem} — generating it now.\n")
         cmd_setup(None)
 
 
-def ensure_logged_in():
+# Set once whoami (or login) succeeds, so later commands in the same
+# process skip the extra subprocess round-trip.
+_LOGIN_VERIFIED = False
+
+
+async def ensure_logged_in_async():
     """Check aiandme login status, prompt to log in if needed."""
-    result = subprocess.run(
-        "aiandme whoami",
-        shell=True,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    global _LOGIN_VERIFIED
+    if _LOGIN_VERIFIED:
+        return
+    try:
+        # Only the exit code matters — discard output rather than buffer it
+        proc = await asyncio.create_subprocess_exec(
+            *_WHOAMI_CMD,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        returncode = await proc.wait()
+    except FileNotFoundError:
+        returncode = 127
+    if returncode != 0:
         print("You are not logged in to AIandMe.")
         print("Opening browser for authentication...\n")
-        run("aiandme login")
+        if not await run_async(_LOGIN_CMD):
+            return
+    _LOGIN_VERIFIED = True
+
+
+def ensure_logged_in():
+    """Synchronous wrapper around ``ensure_logged_in_async``."""
+    asyncio.run(ensure_logged_in_async())
 
 
 # ── Commands ────────────────────────────────────────────────────────────
 
 def cmd_setup(_args):
     """Generate bot.json from environment variables."""
+    write_bot_json(force=True)
+
+
+def write_bot_json(force=False):
+    """Write bot.json, skipping the write when it is already current.
+
+    The skip only happens without ``force``: an explicit ``setup`` always
+    rewrites the file, so it can repair a hand-edited bot.json.
+    """
+    import hashlib
+    import json
+
     url, key = load_config()
 
+    # bot.json is a pure function of (format version, url, key): skip
+    # regeneration when the sidecar hash written alongside it still matches.
+    config_hash = hashlib.sha256(
+        f"{BOT_CONFIG_FORMAT_VERSION}:{url}:{key}".encode()
+    ).hexdigest()
+    if (
+        not force
+        and read_text(BOT_CONFIG_HASH_FILE) == config_hash
+        and bot_json_problem() is None
+    ):
+        print(f"{BOT_CONFIG_FILE} is up-to-date")
+        return
+
     bot_config = {
         "streaming": False,
         "thread_auth": {
@@ -119,8 +485,9 @@ def cmd_setup(_args):
         },
     }
 
-    with open(BOT_CONFIG_FILE, "w") as f:
-        json.dump(bot_config, f, indent=2)
+    # Hash goes last, so an interrupted write is regenerated next time
+    write_atomic(BOT_CONFIG_FILE, json.dumps(bot_config, indent=2))
+    write_atomic(BOT_CONFIG_HASH_FILE, config_hash)
 
     print(f"Generated {BOT_CONFIG_FILE}")
     print(f"  API URL: {url}")
@@ -133,7 +500,26 @@ def cmd_init(_args):
     """Scan the bot and create an aiandme project."""
     ensure_logged_in()
     ensure_bot_json()
-    run(f'aiandme init -e {BOT_CONFIG_FILE}')
+    run(_INIT_CMD)
+
+
+def build_test_cmd(category, level, args):
+    """Build the ``aiandme test`` argv for one test category."""
+    cmd = [
+        "aiandme", "test",
+        "-e", BOT_CONFIG_FILE,
+        "-t", category,
+        "-l", level,
+        "--wait",
+    ]
+
+    if getattr(args, "adaptive", False):
+        cmd.append("--adaptive")
+
+    if getattr(args, "fail_on", None):
+        cmd.append(f"--fail-on={args.fail_on}")
+
+    return cmd
 
 
 def cmd_test(args):
@@ -141,6 +527,29 @@ def cmd_test(args):
     ensure_logged_in()
     ensure_bot_json()
 
+    # Determine test level
+    level = getattr(args, "level", "unit")
+    if level not in TEST_LEVELS:
+        sys.exit(f"Error: level must be one of {TEST_LEVELS}")
+
+    # Sweep every category concurrently
+    if getattr(args, "all", False):
+        max_concurrent = getattr(args, "max_concurrent", None)
+        if max_concurrent is None:
+            max_concurrent = DEFAULT_MAX_CONCURRENT
+        rate = getattr(args, "rate", None)
+        if rate is None:
+            rate = DEFAULT_RATE_PER_MINUTE
+        jobs = [
+            (build_test_cmd(category, level, args), name)
+            for name, category in TEST_CATEGORIES.items()
+        ]
+        results = asyncio.run(run_bounded(jobs, max_concurrent, rate))
+        failed = results.count(False)
+        if failed:
+            sys.exit(f"\nError: {failed} of {len(jobs)} test categories failed")
+        return
+
     # Determine test category
     if getattr(args, "single", False):
         category = TEST_CATEGORIES["single"]
@@ -153,51 +562,31 @@ def cmd_test(args):
     else:
         category = TEST_CATEGORIES["multi"]
 
-    # Determine test level
-    level = getattr(args, "level", "unit")
-    if level not in TEST_LEVELS:
-        sys.exit(f"Error: level must be one of {TEST_LEVELS}")
-
-    # Build command
-    cmd = (
-        f"aiandme test"
-        f" -e {BOT_CONFIG_FILE}"
-        f" -t {category}"
-        f" -l {level}"
-        f" --wait"
-    )
-
-    if getattr(args, "adaptive", False):
-        cmd += " --adaptive"
-
-    if getattr(args, "fail_on", None):
-        cmd += f" --fail-on={args.fail_on}"
-
-    run(cmd)
+    run(build_test_cmd(category, level, args))
 
 
 def cmd_status(args):
     """Check experiment status."""
     ensure_logged_in()
-    cmd = "aiandme status"
+    cmd = ["aiandme", "status"]
     if getattr(args, "watch", False):
-        cmd += " --watch"
+        cmd.append("--watch")
     run(cmd)
 
 
 def cmd_logs(args):
     """View test findings."""
     ensure_logged_in()
-    cmd = "aiandme logs"
+    cmd = ["aiandme", "logs"]
     if getattr(args, "failed", False):
-        cmd += " --verdict fail"
+        cmd += ["--verdict", "fail"]
     run(cmd)
 
 
 def cmd_posture(_args):
     """View security posture score."""
     ensure_logged_in()
-    run("aiandme posture")
+    run(_POSTURE_CMD)
 
 
 def cmd_guardrails(args):
@@ -205,55 +594,53 @@ def cmd_guardrails(args):
     ensure_logged_in()
     vendor = getattr(args, "vendor", "aiandme")
     fmt = getattr(args, "format", "json")
-    cmd = f"aiandme guardrails --vendor {vendor} --format {fmt}"
+    cmd = ["aiandme", "guardrails", "--vendor", vendor, "--format", fmt]
     if getattr(args, "output", None):
-        cmd += f" -o {args.output}"
+        cmd += ["-o", args.output]
     run(cmd)
 
 
-def cmd_full(_args):
-    """Run the full red teaming workflow end-to-end."""
-    print("=" * 60)
-    print("  Foodie AI — Full Red Teaming Workflow")
-    print("=" * 60)
+async def full_async():
+    """Drive the full workflow on a single event loop.
+
+    The six steps collapse into four stages; independent work inside a
+    stage runs concurrently.
+    """
+    # Steps 1-2: Generate bot.json while the whoami check is in flight —
+    # one is local file I/O, the other a network round-trip.
+    print("\n--- Steps 1-2/6: Generating bot.json and checking authentication ---")
+    # Load .env up front: its sys.exit would otherwise surface from the
+    # worker thread as an unretrieved task exception with a traceback.
+    load_config()
+    await asyncio.gather(
+        asyncio.to_thread(write_bot_json),
+        ensure_logged_in_async(),
+    )
 
-    # Step 1: Setup
-    print("\n--- Step 1/6: Generating bot.json ---")
-    cmd_setup(None)
+    # Step 3: Init project — the tests below need it
+    print("\n--- Step 3/6: Scanning bot and creating project ---")
+    await run_async(_INIT_CMD)
 
-    # Step 2: Login check
-    print("\n--- Step 2/6: Checking authentication ---")
-    ensure_logged_in()
+    # Steps 4-5: The two experiments are independent, so wall-clock is
+    # max() not sum(); run_bounded applies the usual semaphore and limiter.
+    print("\n--- Steps 4-5/6: Running single-turn and multi-turn OWASP attacks ---")
+    await run_bounded([(_SINGLE_CMD, "single"), (_MULTI_CMD, "multi")], check=False)
 
-    # Step 3: Init project
-    print("\n--- Step 3/6: Scanning bot and creating project ---")
-    run(f"aiandme init -e {BOT_CONFIG_FILE}")
-
-    # Step 4: Run single-turn attacks
-    print("\n--- Step 4/6: Running single-turn OWASP attacks ---")
-    run(
-        f"aiandme test -e {BOT_CONFIG_FILE}"
-        f" -t {TEST_CATEGORIES['single']}"
-        f" -l unit --wait",
-        check=False,
+    # Step 6: Results
+    print("\n--- Step 6/6: Results (security posture and failed findings) ---")
+    await asyncio.gather(
+        run_async(_POSTURE_CMD, check=False, tag="posture"),
+        run_async(_FAILED_LOGS_CMD, check=False, tag="failed"),
     )
 
-    # Step 5: Run multi-turn attacks
-    print("\n--- Step 5/6: Running multi-turn OWASP attacks ---")
-    run(
-        f"aiandme test -e {BOT_CONFIG_FILE}"
-        f" -t {TEST_CATEGORIES['multi']}"
-        f" -l unit --wait",
-        check=False,
-    )
 
-    # Step 6: Results
-    print("\n--- Step 6/6: Results ---")
-    print("\n>> Security Posture:")
-    run("aiandme posture", check=False)
+def cmd_full(_args):
+    """Run the full red teaming workflow end-to-end."""
+    print("=" * 60)
+    print("  Foodie AI — Full Red Teaming Workflow")
+    print("=" * 60)
 
-    print("\n>> Failed Findings:")
-    run("aiandme logs --verdict fail", check=False)
+    asyncio.run(full_async())
 
     print("\n" + "=" * 60)
     print("  Red teaming complete!")
@@ -275,6 +662,7 @@ def main():
             "  python redteam.py test --single       Run single-turn attacks\n"
             "  python redteam.py test --adaptive     Run adaptive attacks\n"
             "  python redteam.py test --level system  Run deeper system-level tests\n"
+            "  python redteam.py test --all          Run every category concurrently\n"
             "  python redteam.py full                Run the complete workflow\n"
             "  python redteam.py posture             View security score\n"
             "  python redteam.py logs --failed       View failed findings only\n"
@@ -296,6 +684,7 @@ def main():
     test_type.add_argument("--agentic", action="store_true", help="Agentic multi-turn attacks")
     test_type.add_argument("--behavioral", action="store_true", help="Behavioral QA tests")
     test_type.add_argument("--adaptive", action="store_true", help="Adaptive multi-turn attacks")
+    test_type.add_argument("--all", action="store_true", help="Run every test category concurrently")
     test_parser.add_argument(
         "--level", choices=TEST_LEVELS, default="unit",
         help="Testing depth: unit (~20min), system (~45min), acceptance (~90min)",
@@ -304,6 +693,14 @@ def main():
         "--fail-on", choices=("critical", "high", "medium", "low", "any"),
         help="Exit with error if findings meet this severity threshold",
     )
+    test_parser.add_argument(
+        "--max-concurrent", type=int, metavar="N",
+        help=f"With --all, run at most N categories at once (default: {DEFAULT_MAX_CONCURRENT})",
+    )
+    test_parser.add_argument(
+        "--rate", type=int, metavar="N",
+        help=f"With --all, start at most N runs per minute (default: {DEFAULT_RATE_PER_MINUTE})",
+    )
 
     # status
     status_parser = subparsers.add_parser("status", help="Check experiment status")
@@ -330,6 +727,17 @@ def main():
 
     args = parser.parse_args()
 
+    if args.command == "test" and args.max_concurrent is not None:
+        if not args.all:
+            parser.error("--max-concurrent requires --all")
+        if args.max_concurrent < 1:
+            parser.error("--max-concurrent must be at least 1")
+    if args.command == "test" and args.rate is not None:
+        if not args.all:
+            parser.error("--rate requires --all")
+        if args.rate < 1:
+            parser.error("--rate must be at least 1")
+
     commands = {
         "setup": cmd_setup,
         "init": cmd_init,